@@ -12,6 +12,14 @@
 - インターフェースの明確化
 """
 
+import sys
+from array import array
+from collections.abc import Sequence
+from datetime import datetime
+from operator import attrgetter
+from time import time_ns
+from typing import NamedTuple
+
 
 # ============================================
 # 悪い例: カプセル化されていない
@@ -30,61 +38,109 @@ print(f"悪い例 - 残高: {bad_account.balance}")  # -500
 # ============================================
 # 良い例: カプセル化されている
 # ============================================
+class Transaction(NamedTuple):
+    """取引履歴の1件分（Statementから読み出す時に組み立てる）"""
+    type: str
+    amount: float
+    timestamp: str     # ISO形式（読み出す時に変換する）
+    timestamp_ns: int  # 記録したままの値（time_ns()）
+
+
+# 取引種別の文字列は1つのオブジェクトを使い回す（比較が同一性チェックで済む）
+_DEPOSIT = sys.intern("deposit")
+_WITHDRAW = sys.intern("withdraw")
+
+# 取引種別は1バイトのコードで記録する
+_TYPE_CODES = {_DEPOSIT: ord("d"), _WITHDRAW: ord("w")}
+_TYPE_NAMES = {code: name for name, code in _TYPE_CODES.items()}
+
+class Statement(Sequence):
+    """
+    取引履歴の読み取り専用ビュー
+    履歴をコピーせず、作成時点までの取引だけを見せる
+    len()・添字アクセス・何度でも繰り返し可能（リストと同じように使える）
+    """
+
+    __slots__ = ("_types", "_amounts", "_timestamps", "_count")
+
+    def __init__(self, types: bytearray, amounts: list, timestamps: array):
+        self._types = types
+        self._amounts = amounts
+        self._timestamps = timestamps
+        self._count = len(types)  # 後から追加された取引は含めない
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(self._count)[index]]
+        i = range(self._count)[index]  # 負の添字の変換と範囲外のIndexError
+        ns = self._timestamps[i]
+        timestamp = datetime.fromtimestamp(ns / 1e9).isoformat()  # 読み出した取引だけ変換
+        return Transaction(_TYPE_NAMES[self._types[i]], self._amounts[i], timestamp, ns)
+
+
+# 入出金メッセージのテンプレート（format メソッドを一度だけ取り出しておく）
+_DEPOSIT_OK = "入金完了: ¥{0:,.0f} → 残高: ¥{1:,.0f}".format
+_WITHDRAW_OK = "出金完了: ¥{0:,.0f} → 残高: ¥{1:,.0f}".format
+_INSUFFICIENT = "エラー: 残高不足です（残高: ¥{0:,.0f}）".format
+
+
 class BankAccount:
+    # __slots__: インスタンス辞書(__dict__)を作らず、属性を固定領域に格納する
+    # __balance などは自動で _BankAccount__balance にマングリングされる
+    __slots__ = ("__owner", "__balance", "__types", "__amounts", "__timestamps")
+
     def __init__(self, owner: str, initial_balance: float = 0):
-        self._owner = owner           # 慣例的なprotected（1つのアンダースコア）
+        self.__owner = owner
         self.__balance = initial_balance  # private（2つのアンダースコア）
-        self.__transaction_history = []
-
-    # プロパティ: 読み取り専用アクセスを提供
-    @property
-    def balance(self) -> float:
-        """残高を取得（読み取り専用）"""
-        return self.__balance
+        # 取引履歴: 1件ごとにdictを作らず、項目ごとの配列に並べて持つ
+        self.__types = bytearray()
+        self.__amounts = []  # 金額は渡された値のまま（intやDecimalをfloatにしない）
+        self.__timestamps = array("q")  # ナノ秒の整数
 
-    @property
-    def owner(self) -> str:
-        return self._owner
+    # 読み取り専用の属性: getterにC実装のattrgetterを使い、Pythonの関数呼び出しを省く
+    # setter / deleter が無いので、代入も削除もAttributeErrorになる
+    owner = property(attrgetter("_BankAccount__owner"), doc="口座名義（読み取り専用）")
+    balance = property(attrgetter("_BankAccount__balance"), doc="残高（読み取り専用）")
 
     # バリデーション付きのメソッド
     def deposit(self, amount: float) -> bool:
         """入金処理"""
         if amount <= 0:
-            print(f"エラー: 入金額は正の数である必要があります")
+            print("エラー: 入金額は正の数である必要があります")
             return False
 
         self.__balance += amount
-        self.__record_transaction("deposit", amount)
-        print(f"入金完了: ¥{amount:,.0f} → 残高: ¥{self.__balance:,.0f}")
+        self.__record_transaction(_DEPOSIT, amount)
+        print(_DEPOSIT_OK(amount, self.__balance))
         return True
 
     def withdraw(self, amount: float) -> bool:
         """出金処理"""
         if amount <= 0:
-            print(f"エラー: 出金額は正の数である必要があります")
+            print("エラー: 出金額は正の数である必要があります")
             return False
         if amount > self.__balance:
-            print(f"エラー: 残高不足です（残高: ¥{self.__balance:,.0f}）")
+            print(_INSUFFICIENT(self.__balance))
             return False
 
         self.__balance -= amount
-        self.__record_transaction("withdraw", amount)
-        print(f"出金完了: ¥{amount:,.0f} → 残高: ¥{self.__balance:,.0f}")
+        self.__record_transaction(_WITHDRAW, amount)
+        print(_WITHDRAW_OK(amount, self.__balance))
         return True
 
     # privateメソッド: 内部でのみ使用
     def __record_transaction(self, transaction_type: str, amount: float):
         """取引履歴を記録（内部使用のみ）"""
-        from datetime import datetime
-        self.__transaction_history.append({
-            "type": transaction_type,
-            "amount": amount,
-            "timestamp": datetime.now().isoformat()
-        })
+        self.__types.append(_TYPE_CODES[transaction_type])
+        self.__amounts.append(amount)
+        self.__timestamps.append(time_ns())
 
-    def get_statement(self) -> list:
-        """取引履歴のコピーを返す（元データは保護）"""
-        return self.__transaction_history.copy()
+    def get_statement(self) -> Statement:
+        """取引履歴の読み取り専用ビューを返す（元データは保護）"""
+        return Statement(self.__types, self.__amounts, self.__timestamps)
 
 
 # ============================================
@@ -97,7 +153,7 @@ if __name__ == "__main__":
 
     account = BankAccount("田中太郎", 10000)
 
-    # プロパティでアクセス
+    # 読み取り専用の属性でアクセス
     print(f"口座名義: {account.owner}")
     print(f"初期残高: ¥{account.balance:,.0f}")
 
@@ -109,9 +165,9 @@ if __name__ == "__main__":
     account.deposit(-1000)     # エラー: 不正な金額
 
     # 直接アクセスしようとしても...
-    # account.__balance = -500  # AttributeError
-    # account.balance = -500    # プロパティはsetterがないため設定不可
+    # account.balance = -500  # AttributeError（setterが無い）
+    # account.owner = "別人"    # AttributeError
 
     print("\n--- 取引履歴 ---")
     for tx in account.get_statement():
-        print(f"  {tx['type']}: ¥{tx['amount']:,.0f}")
+        print(f"  {tx.type}: ¥{tx.amount:,.0f}")
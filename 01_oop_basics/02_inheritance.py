@@ -12,7 +12,12 @@
 - 共通の振る舞いの一元管理
 """
 
+import math
 from abc import ABC, abstractmethod
+from array import array
+from dataclasses import dataclass
+
+from _numba_compat import njit, prange
 
 
 # ============================================
@@ -21,6 +26,8 @@ from abc import ABC, abstractmethod
 class Animal:
     """動物の基底クラス"""
 
+    __slots__ = ("name", "age")
+
     def __init__(self, name: str, age: int):
         self.name = name
         self.age = age
@@ -35,6 +42,8 @@ class Animal:
 class Dog(Animal):
     """犬クラス - Animalを継承"""
 
+    __slots__ = ("breed",)  # 親クラスのスロットに追加する分だけ書く
+
     def __init__(self, name: str, age: int, breed: str):
         super().__init__(name, age)  # 親クラスの__init__を呼び出し
         self.breed = breed  # 子クラス固有の属性
@@ -49,6 +58,8 @@ class Dog(Animal):
 class Cat(Animal):
     """猫クラス - Animalを継承"""
 
+    __slots__ = ("indoor",)
+
     def __init__(self, name: str, age: int, indoor: bool = True):
         super().__init__(name, age)
         self.indoor = indoor
@@ -66,6 +77,8 @@ class Cat(Animal):
 class Shape(ABC):
     """図形の抽象基底クラス"""
 
+    __slots__ = ()
+
     @abstractmethod
     def area(self) -> float:
         """面積を計算（子クラスで実装必須）"""
@@ -81,12 +94,12 @@ class Shape(ABC):
         return f"面積: {self.area():.2f}, 周囲: {self.perimeter():.2f}"
 
 
+@dataclass(slots=True, eq=False)  # __init__と__slots__を自動生成（==は同一性で比較のまま）
 class Rectangle(Shape):
     """長方形"""
 
-    def __init__(self, width: float, height: float):
-        self.width = width
-        self.height = height
+    width: float
+    height: float
 
     def area(self) -> float:
         return self.width * self.height
@@ -95,27 +108,60 @@ class Rectangle(Shape):
         return 2 * (self.width + self.height)
 
 
+@dataclass(slots=True, eq=False)
 class Circle(Shape):
     """円"""
 
-    def __init__(self, radius: float):
-        self.radius = radius
+    radius: float
 
     def area(self) -> float:
-        import math
-        return math.pi * self.radius ** 2
+        return math.pi * self.radius * self.radius
 
     def perimeter(self) -> float:
-        import math
         return 2 * math.pi * self.radius
 
 
+try:  # Cython版（_shapes_cy.pyx）がビルドされていればそちらを使う
+    from _shapes_cy import Circle, Rectangle
+except ImportError:
+    pass
+else:
+    # cdef classはShapeを継承できないので、仮想サブクラスとして登録する
+    Shape.register(Rectangle)
+    Shape.register(Circle)
+
+
+# ============================================
+# 大量の図形をまとめて計算する（配列ベース）
+# ============================================
+RECTANGLE, CIRCLE = 0, 1  # kinds配列に入れる図形の種類
+
+
+@njit(parallel=True, cache=True)
+def batch_describe(widths, heights, radii, kinds, areas, perimeters):
+    """
+    図形の面積・周囲を一括計算し、areas / perimetersに書き込む
+
+    1図形ずつメソッドを呼ぶ代わりに、属性ごとの配列（width, height, radius）を
+    1つのループで処理する。numbaがあればJITコンパイルされる。
+    """
+    for i in prange(len(kinds)):
+        if kinds[i] == RECTANGLE:
+            areas[i] = widths[i] * heights[i]
+            perimeters[i] = 2 * (widths[i] + heights[i])
+        else:
+            areas[i] = math.pi * radii[i] * radii[i]
+            perimeters[i] = 2 * math.pi * radii[i]
+
+
 # ============================================
 # 多重継承（注意して使用）
 # ============================================
 class Flyable:
     """飛べる能力を表すMixin"""
 
+    __slots__ = ()  # Mixinは空にしておかないと__dict__が復活する
+
     def fly(self) -> str:
         return f"{self.name}が空を飛んでいる"
 
@@ -123,6 +169,8 @@ class Flyable:
 class Swimmable:
     """泳げる能力を表すMixin"""
 
+    __slots__ = ()
+
     def swim(self) -> str:
         return f"{self.name}が泳いでいる"
 
@@ -130,6 +178,8 @@ class Swimmable:
 class Duck(Animal, Flyable, Swimmable):
     """アヒル - 複数の能力を持つ"""
 
+    __slots__ = ()
+
     def speak(self) -> str:
         return "ガーガー！"
 
@@ -158,10 +208,10 @@ if __name__ == "__main__":
     print("抽象クラスを使った継承")
     print("="*50)
 
-    shapes: list[Shape] = [
+    shapes: tuple[Shape, ...] = (
         Rectangle(10, 5),
         Circle(7),
-    ]
+    )
 
     for shape in shapes:
         print(f"{shape.__class__.__name__}: {shape.describe()}")
@@ -169,6 +219,17 @@ if __name__ == "__main__":
     # 抽象クラスは直接インスタンス化できない
     # shape = Shape()  # TypeError
 
+    # 同じ計算を配列でまとめて行う
+    kinds = array("b", [RECTANGLE, CIRCLE])
+    widths = array("d", [10, 0])
+    heights = array("d", [5, 0])
+    radii = array("d", [0, 7])
+    areas = array("d", [0.0] * len(kinds))
+    perimeters = array("d", [0.0] * len(kinds))
+    batch_describe(widths, heights, radii, kinds, areas, perimeters)
+    for area, perimeter in zip(areas, perimeters):
+        print(f"一括計算: 面積: {area:.2f}, 周囲: {perimeter:.2f}")
+
     print("\n" + "="*50)
     print("多重継承（Mixin）")
     print("="*50)
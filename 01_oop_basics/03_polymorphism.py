@@ -12,7 +12,10 @@
 - 「何をするか」と「どうするか」の分離
 """
 
+import sys
 from abc import ABC, abstractmethod
+from collections.abc import Iterable
+from dataclasses import dataclass, field
 from typing import Protocol
 
 
@@ -22,6 +25,8 @@ from typing import Protocol
 class PaymentMethod(ABC):
     """支払い方法の抽象クラス"""
 
+    __slots__ = ()
+
     @abstractmethod
     def pay(self, amount: int) -> str:
         pass
@@ -31,34 +36,53 @@ class PaymentMethod(ABC):
         pass
 
 
+@dataclass(slots=True, eq=False)
 class CreditCard(PaymentMethod):
-    def __init__(self, card_number: str):
-        self.card_number = card_number
+    card_number: str
+    # マスク済みの番号と、それを作った時のカード番号（支払いのたびに作らない）
+    _masked: str = field(init=False, repr=False, default="")
+    _masked_from: str | None = field(init=False, repr=False, default=None)
+
+    def _masked_number(self) -> str:
+        # カード番号が書き換えられていたら作り直す
+        if self._masked_from is not self.card_number:
+            self._masked = "*" * 12 + self.card_number[-4:]
+            self._masked_from = self.card_number
+        return self._masked
+
+    def __repr__(self) -> str:
+        # カード番号はreprにも出さない
+        return f"CreditCard(card_number={self._masked_number()!r})"
 
     def pay(self, amount: int) -> str:
-        masked = "*" * 12 + self.card_number[-4:]
-        return f"クレジットカード({masked})で¥{amount:,}を支払いました"
+        return f"クレジットカード({self._masked_number()})で¥{amount:,}を支払いました"
 
     def get_name(self) -> str:
         return "クレジットカード"
 
 
+@dataclass(slots=True, eq=False)
 class BankTransfer(PaymentMethod):
-    def __init__(self, bank_name: str, account: str):
-        self.bank_name = bank_name
-        self.account = account
+    bank_name: str
+    account: str
+    # メッセージの金額より前の部分と、それを作った時の銀行名
+    _prefix: str = field(init=False, repr=False, default="")
+    _prefix_from: str | None = field(init=False, repr=False, default=None)
 
     def pay(self, amount: int) -> str:
-        return f"{self.bank_name}から¥{amount:,}を振り込みました"
+        if self._prefix_from is not self.bank_name:  # 銀行名が変わった時だけ作り直す
+            self._prefix = f"{self.bank_name}から¥"
+            self._prefix_from = self.bank_name
+        return f"{self._prefix}{amount:,}を振り込みました"
 
     def get_name(self) -> str:
         return "銀行振込"
 
 
+@dataclass(slots=True, eq=False)
 class ElectronicMoney(PaymentMethod):
-    def __init__(self, service_name: str, balance: int):
-        self.service_name = service_name
-        self.balance = balance
+    service_name: str
+    balance: int
 
     def pay(self, amount: int) -> str:
         if amount > self.balance:
@@ -83,16 +107,22 @@ def process_payment(method: PaymentMethod, amount: int):
 # ダックタイピングによるポリモーフィズム（Python的）
 # ============================================
 class FileLogger:
+    __slots__ = ()
+
     def log(self, message: str):
         print(f"[FILE] {message}")
 
 
 class ConsoleLogger:
+    __slots__ = ()
+
     def log(self, message: str):
         print(f"[CONSOLE] {message}")
 
 
 class RemoteLogger:
+    __slots__ = ()
+
     def log(self, message: str):
         print(f"[REMOTE] Sending: {message}")
 
@@ -116,58 +146,77 @@ class Drawable(Protocol):
         ...
 
 
+@dataclass(slots=True, eq=False)
 class Button:
-    def __init__(self, label: str):
-        self.label = label
+    label: str
 
     def draw(self) -> str:
         return f"[  {self.label}  ]"
 
 
+@dataclass(slots=True, eq=False)
 class TextField:
-    def __init__(self, placeholder: str):
-        self.placeholder = placeholder
-        self.value = ""
+    placeholder: str
+    value: str = field(default="", init=False)
 
     def draw(self) -> str:
         content = self.value if self.value else self.placeholder
         return f"| {content} |"
 
 
+@dataclass(slots=True, eq=False)
 class CheckBox:
-    def __init__(self, label: str, checked: bool = False):
-        self.label = label
-        self.checked = checked
+    label: str
+    checked: bool = False
 
     def draw(self) -> str:
         mark = "x" if self.checked else " "
         return f"[{mark}] {self.label}"
 
 
-def render_ui(components: list[Drawable]):
+def render_ui(components: Iterable[Drawable]):
     """Drawableプロトコルに従うオブジェクトを描画"""
-    print("┌" + "─" * 30 + "┐")
-    for component in components:
-        print(f"│ {component.draw():<28} │")
-    print("└" + "─" * 30 + "┘")
+    draws = [component.draw for component in components]  # メソッドの取り出しはループの外で
+    lines = ["┌" + "─" * 30 + "┐\n"]
+    for draw in draws:
+        lines.append(f"│ {draw():<28} │\n")
+    lines.append("└" + "─" * 30 + "┘\n")
+    sys.stdout.write("".join(lines))  # 1行ずつではなくまとめて出力
 
 
 # ============================================
 # 悪い例: ポリモーフィズムを使わない場合
 # ============================================
+def _pay_credit_card(amount: int, **kwargs):
+    card = kwargs.get("card_number", "")
+    print(f"クレジットカードで¥{amount:,}を支払いました")
+
+
+def _pay_bank(amount: int, **kwargs):
+    print(f"銀行振込で¥{amount:,}を支払いました")
+
+
+def _pay_emoney(amount: int, **kwargs):
+    print(f"電子マネーで¥{amount:,}を支払いました")
+
+
+# 支払い種別の文字列 → 処理関数（elifを並べる代わりに辞書で引く）
+_HANDLERS = {
+    "credit_card": _pay_credit_card,
+    "bank": _pay_bank,
+    "emoney": _pay_emoney,
+}
+
+
 def process_payment_bad(payment_type: str, amount: int, **kwargs):
     """
     悪い例: 型による条件分岐
-    新しい支払い方法を追加するたびにこの関数を修正する必要がある
+    新しい支払い方法を追加するたびにこのモジュールを修正する必要がある
     """
-    if payment_type == "credit_card":
-        card = kwargs.get("card_number", "")
-        print(f"クレジットカードで¥{amount:,}を支払いました")
-    elif payment_type == "bank":
-        print(f"銀行振込で¥{amount:,}を支払いました")
-    elif payment_type == "emoney":
-        print(f"電子マネーで¥{amount:,}を支払いました")
-    # 新しい支払い方法を追加するには、ここにelif を追加...
+    if handler := _HANDLERS.get(payment_type):
+        handler(amount, **kwargs)
+    # 辞書で分岐を引けても、新しい支払い方法を追加するには
+    # ここに関数を書いて_HANDLERSに登録する必要がある...
     # → 開放閉鎖の原則（OCP）に違反
 
 
@@ -179,11 +228,11 @@ if __name__ == "__main__":
     print("継承によるポリモーフィズム")
     print("="*50)
 
-    payments: list[PaymentMethod] = [
+    payments: tuple[PaymentMethod, ...] = (
         CreditCard("1234567890123456"),
         BankTransfer("三菱UFJ銀行", "123-4567890"),
         ElectronicMoney("PayPay", 5000),
-    ]
+    )
 
     for payment in payments:
         process_payment(payment, 1000)
@@ -193,7 +242,7 @@ if __name__ == "__main__":
     print("ダックタイピング")
     print("="*50)
 
-    loggers = [FileLogger(), ConsoleLogger(), RemoteLogger()]
+    loggers = (FileLogger(), ConsoleLogger(), RemoteLogger())
 
     for logger in loggers:
         write_log(logger, "アプリケーションが起動しました")
@@ -202,11 +251,11 @@ if __name__ == "__main__":
     print("Protocol（構造的部分型）")
     print("="*50)
 
-    ui_components: list[Drawable] = [
+    ui_components: tuple[Drawable, ...] = (
         TextField("名前を入力"),
         TextField("メールアドレス"),
         CheckBox("利用規約に同意する"),
         Button("送信"),
-    ]
+    )
 
     render_ui(ui_components)
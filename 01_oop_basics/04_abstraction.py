@@ -13,9 +13,13 @@
 """
 
 from abc import ABC, abstractmethod
+from array import array
 from typing import Any
+import asyncio
 import json
 
+from _numba_compat import njit, prange
+
 
 # ============================================
 # 抽象化の例: データベース接続
@@ -26,6 +30,8 @@ class Database(ABC):
     利用者は具体的なDB実装を知らなくても使える
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def connect(self) -> None:
         """接続を確立"""
@@ -51,6 +57,8 @@ class Database(ABC):
 class MySQLDatabase(Database):
     """MySQL実装（実際はmysql-connector等を使用）"""
 
+    __slots__ = ("host", "user", "password", "database", "_connected")
+
     def __init__(self, host: str, user: str, password: str, database: str):
         self.host = host
         self.user = user
@@ -80,6 +88,8 @@ class MySQLDatabase(Database):
 class SQLiteDatabase(Database):
     """SQLite実装"""
 
+    __slots__ = ("filepath", "_connected")
+
     def __init__(self, filepath: str):
         self.filepath = filepath
         self._connected = False
@@ -106,21 +116,27 @@ class SQLiteDatabase(Database):
 class EmailService:
     """メール送信の詳細"""
 
-    def send(self, to: str, subject: str, body: str):
+    __slots__ = ()
+
+    async def send(self, to: str, subject: str, body: str):
         print(f"  [Email] To: {to}, Subject: {subject}")
 
 
 class SMSService:
     """SMS送信の詳細"""
 
-    def send(self, phone: str, message: str):
+    __slots__ = ()
+
+    async def send(self, phone: str, message: str):
         print(f"  [SMS] To: {phone}, Message: {message[:20]}...")
 
 
 class PushNotificationService:
     """プッシュ通知の詳細"""
 
-    def send(self, device_id: str, title: str, body: str):
+    __slots__ = ()
+
+    async def send(self, device_id: str, title: str, body: str):
         print(f"  [Push] Device: {device_id}, Title: {title}")
 
 
@@ -130,26 +146,36 @@ class NotificationFacade:
     複雑な内部サービスをシンプルなインターフェースで提供
     """
 
+    __slots__ = ("_email", "_sms", "_push")
+
     def __init__(self):
         self._email = EmailService()
         self._sms = SMSService()
         self._push = PushNotificationService()
 
-    def notify_user(self, user: dict, message: str, title: str = "お知らせ"):
+    async def notify_user(self, user: dict, message: str, title: str = "お知らせ"):
         """
         ユーザーに通知を送信
         利用者は内部の複雑さを知る必要がない
+        各サービスへの送信は順番に待たず、同時に行う
         """
         print(f"ユーザー {user['name']} に通知を送信:")
 
+        tasks = []
         if email := user.get("email"):
-            self._email.send(email, title, message)
+            tasks.append(self._email.send(email, title, message))
 
         if phone := user.get("phone"):
-            self._sms.send(phone, message)
+            tasks.append(self._sms.send(phone, message))
 
         if device_id := user.get("device_id"):
-            self._push.send(device_id, title, message)
+            tasks.append(self._push.send(device_id, title, message))
+
+        await asyncio.gather(*tasks)
+
+    def notify_user_sync(self, user: dict, message: str, title: str = "お知らせ"):
+        """notify_userの同期版（イベントループの外から呼ぶ場合）"""
+        asyncio.run(self.notify_user(user, message, title))
 
 
 # ============================================
@@ -158,6 +184,8 @@ class NotificationFacade:
 class WeatherAPI(ABC):
     """天気APIの抽象クラス"""
 
+    __slots__ = ()
+
     @abstractmethod
     def get_temperature(self, city: str) -> float:
         pass
@@ -166,6 +194,8 @@ class WeatherAPI(ABC):
 class RealWeatherAPI(WeatherAPI):
     """本番用: 実際のAPIを呼び出す"""
 
+    __slots__ = ()
+
     def get_temperature(self, city: str) -> float:
         # 実際はrequests等でAPIを呼び出す
         print(f"外部API呼び出し: {city}の気温を取得")
@@ -175,6 +205,8 @@ class RealWeatherAPI(WeatherAPI):
 class MockWeatherAPI(WeatherAPI):
     """テスト用: 固定値を返す"""
 
+    __slots__ = ("temperature",)
+
     def __init__(self, temperature: float = 20.0):
         self.temperature = temperature
 
@@ -182,23 +214,42 @@ class MockWeatherAPI(WeatherAPI):
         return self.temperature
 
 
+_FEELINGS = ("暑い", "快適", "涼しい", "寒い")
+
+
+def _feeling_id(temp: float) -> int:
+    """気温から体感の番号（_FEELINGSの添字）を求める"""
+    if temp >= 30:
+        return 0
+    elif temp >= 20:
+        return 1
+    elif temp >= 10:
+        return 2
+    return 3
+
+
+# 1件ずつの呼び出しは普通のPython関数のまま、一括処理だけJITコンパイルする
+_feeling_id_jit = njit(cache=True)(_feeling_id)
+
+
+@njit(parallel=True, cache=True)
+def feelings(temps, out):
+    """多数の都市の気温をまとめて分類し、体感の番号をoutに書き込む"""
+    for i in prange(len(temps)):
+        out[i] = _feeling_id_jit(temps[i])
+
+
 class WeatherReport:
     """天気レポート生成クラス"""
 
+    __slots__ = ("_api",)
+
     def __init__(self, api: WeatherAPI):
         self._api = api  # 抽象に依存（依存性注入）
 
     def generate(self, city: str) -> str:
         temp = self._api.get_temperature(city)
-        if temp >= 30:
-            feeling = "暑い"
-        elif temp >= 20:
-            feeling = "快適"
-        elif temp >= 10:
-            feeling = "涼しい"
-        else:
-            feeling = "寒い"
-
+        feeling = _FEELINGS[_feeling_id(temp)]
         return f"{city}の気温は{temp}°C（{feeling}）です"
 
 
@@ -238,7 +289,7 @@ if __name__ == "__main__":
         "device_id": "device_abc123"
     }
 
-    notifier.notify_user(user, "ご注文の商品が発送されました")
+    notifier.notify_user_sync(user, "ご注文の商品が発送されました")
 
     print("\n" + "="*50)
     print("抽象化によるテスト容易性")
@@ -259,3 +310,11 @@ if __name__ == "__main__":
     mock_api = MockWeatherAPI(temperature=5.0)
     report = WeatherReport(mock_api)
     print(report.generate("東京"))
+
+    # 多数の都市の気温をまとめて分類する
+    print("\n--- 一括分類 ---")
+    temps = array("d", [35.0, 25.0, 15.0, 5.0])
+    ids = array("b", bytes(len(temps)))
+    feelings(temps, ids)
+    for temp, feeling_id in zip(temps, ids):
+        print(f"{temp}°C: {_FEELINGS[feeling_id]}")
@@ -0,0 +1,6 @@
+# 口座の残高計算部分（Cython版）の宣言
+cdef class AccountCore:
+    cdef readonly double balance
+
+    cpdef int deposit(self, double amount)
+    cpdef int withdraw(self, double amount)
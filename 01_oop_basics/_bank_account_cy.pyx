@@ -0,0 +1,42 @@
+# cython: language_level=3
+"""
+===========================================
+口座の入出金計算のCython版（任意）
+===========================================
+
+01_encapsulation.py の BankAccount.deposit / withdraw から
+バリデーションと残高更新だけを取り出し、C言語の型付きで実装したもの。
+メッセージ表示や取引履歴は Python 版の BankAccount が担当する。
+（同じ入出金でPython版と同じ残高になることをCIで確認している）
+
+入出金は成功なら0、失敗なら下のエラービットの和を負にした値を返す。
+チェックを分岐ではなくビット演算でまとめているため、
+コンパイル後は条件ごとのジャンプが無くなる。
+"""
+
+# エラービット
+INVALID_AMOUNT = 1      # 金額が0以下
+INSUFFICIENT_FUNDS = 2  # 残高不足
+
+
+cdef class AccountCore:
+    """残高の計算だけを行う口座（Cython版）"""
+
+    def __init__(self, double initial_balance=0):
+        self.balance = initial_balance
+
+    cpdef int deposit(self, double amount):
+        """入金処理（成功なら0、不正な金額なら-INVALID_AMOUNT）"""
+        cdef int err = <int>(amount <= 0.0)
+        if err:
+            return -err
+        self.balance += amount
+        return 0
+
+    cpdef int withdraw(self, double amount):
+        """出金処理（成功なら0、失敗ならエラービットの和を負にした値）"""
+        cdef int err = <int>(amount <= 0.0) | (<int>(amount > self.balance) << 1)
+        if err:
+            return -err
+        self.balance -= amount
+        return 0
@@ -0,0 +1,16 @@
+"""
+numbaの任意インポート
+
+numbaがあれば njit / prange をそのまま使い、
+無い環境では何もしないデコレータと range で代用する（普通のPython関数として動く）。
+"""
+
+try:
+    from numba import njit, prange
+except ImportError:
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+    prange = range
@@ -0,0 +1,13 @@
+# 図形クラス（Cython版）の宣言: 属性をCの型で持つ
+cdef class Rectangle:
+    cdef public double width, height
+
+    cpdef double area(self)
+    cpdef double perimeter(self)
+
+
+cdef class Circle:
+    cdef public double radius
+
+    cpdef double area(self)
+    cpdef double perimeter(self)
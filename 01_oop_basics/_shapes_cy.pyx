@@ -0,0 +1,57 @@
+# cython: language_level=3
+"""
+===========================================
+図形クラスのCython版（任意）
+===========================================
+
+02_inheritance.py の Rectangle / Circle と同じ振る舞いを
+C言語の型付きで実装したもの。ビルド方法は setup.py を参照。
+ビルドされていれば 02_inheritance.py がこちらを使う。
+
+Python版との違い:
+- Shapeを継承できないため、02_inheritance.py で Shape.register() して
+  isinstance(..., Shape) が成り立つようにしている
+- 属性はdoubleで持つので、Rectangle(10, 5) の repr は width=10.0 になる
+  （Python版は渡した int のまま width=10）
+"""
+
+from libc.math cimport M_PI
+
+
+cdef class Rectangle:
+    """長方形（Cython版）"""
+
+    def __init__(self, double width, double height):
+        self.width = width
+        self.height = height
+
+    def __repr__(self):
+        return f"Rectangle(width={self.width!r}, height={self.height!r})"
+
+    cpdef double area(self):
+        return self.width * self.height
+
+    cpdef double perimeter(self):
+        return 2 * (self.width + self.height)
+
+    def describe(self) -> str:
+        return f"面積: {self.area():.2f}, 周囲: {self.perimeter():.2f}"
+
+
+cdef class Circle:
+    """円（Cython版）"""
+
+    def __init__(self, double radius):
+        self.radius = radius
+
+    def __repr__(self):
+        return f"Circle(radius={self.radius!r})"
+
+    cpdef double area(self):
+        return M_PI * self.radius * self.radius
+
+    cpdef double perimeter(self):
+        return 2 * M_PI * self.radius
+
+    def describe(self) -> str:
+        return f"面積: {self.area():.2f}, 周囲: {self.perimeter():.2f}"
@@ -0,0 +1,15 @@
+"""
+Cython版の図形クラスと口座の入出金計算をビルドする（任意）
+
+    pip install cython
+    python setup.py build_ext --inplace
+
+ビルドしなくても各サンプルは純粋なPythonのまま動く。
+"""
+
+from Cython.Build import cythonize
+from setuptools import setup
+
+setup(
+    ext_modules=cythonize(["_shapes_cy.pyx", "_bank_account_cy.pyx"], language_level=3),
+)